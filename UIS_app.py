@@ -2,8 +2,15 @@ import streamlit as st
 st.set_page_config(page_title="Analysis App", layout="wide")  # Must be the very first Streamlit command
 
 
+import os
+from functools import partial
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+
+from build_data import LABEL_DATA_PARQUET
 
 # =============================================================================
 # CUSTOM CSS FOR THEME
@@ -44,22 +51,55 @@ st.markdown(
 # =============================================================================
 # DATA LOADING & PROCESSING
 # =============================================================================
-@st.cache_data
-def load_data():
-    data = pd.read_csv('UNESCO_edu_data.csv')
-    metadata = pd.read_csv('SDG_METADATA.csv')
+@st.cache_data(persist="disk", max_entries=1, show_spinner="Loading UNESCO data…")
+def load_data(data_version):
+    # Pre-merged, typed data written by build_data.py. `data_version` is only
+    # part of the cache key: a rebuilt file invalidates this on-disk entry, and
+    # the derived caches below, which are also passed DATA_VERSION.
+    label_data = pd.read_parquet(LABEL_DATA_PARQUET)
+    
+    # Yearly mean per (indicator, country) for the cross-country bar chart,
+    # rolled up once here instead of on every bar chart render
+    bar_agg = (
+        label_data.drop_duplicates()
+        .groupby(['INDICATOR_ID', 'year', 'country_id'], observed=True)['value']
+        .mean()
+    )
     
-    # Processing and combining data on Indicator ID and Indicator Label
-    data.drop('indicator_desc', inplace=True, axis=1)
-    data.rename(columns={'indicator_id': 'INDICATOR_ID'}, inplace=True)
-    data['INDICATOR_ID'] = data['INDICATOR_ID'].str.upper().str.strip()
+    # Unique (indicator ID, label) pairs per country, sorted by ID, for the
+    # individual analysis multiselect
+    per_country_indicators = {
+        country_code: group[['INDICATOR_ID', 'INDICATOR_LABEL_EN']].drop_duplicates().sort_values('INDICATOR_ID').reset_index(drop=True)
+        for country_code, group in label_data.groupby('country_id', observed=True)
+    }
     
-    # Merge with metadata
-    label_data = pd.merge(data, metadata, on="INDICATOR_ID", how="left")
-    return label_data
+    # Sorted MultiIndex so country / indicator slices avoid full boolean scans
+    label_data = label_data.set_index(['country_id', 'INDICATOR_ID']).sort_index()
+    return label_data, bar_agg, per_country_indicators
 
 # Load and cache the data
-label_data = load_data()
+# Every cached function derived from the data takes this as its first argument,
+# since Streamlit does not hash the globals it reads
+DATA_VERSION = os.path.getmtime(LABEL_DATA_PARQUET)
+label_data, bar_agg, per_country_indicators = load_data(DATA_VERSION)
+
+@st.cache_data
+def get_country_frame(data_version, country_code):
+    """All rows of `label_data` for a single country."""
+    return label_data.xs(country_code, level='country_id').reset_index()
+
+def filter_country_indicators(data_version, country_code, indicators):
+    """
+    Rows of a country's frame for the given indicators (a sorted tuple of IDs).
+    Not cached itself: its only caller, build_line_fig, is cached on the same key.
+    """
+    df = get_country_frame(data_version, country_code)
+    return df[df['INDICATOR_ID'].isin(indicators)]
+
+@st.cache_data
+def get_indicator_frame(data_version, indicator):
+    """All rows of `label_data` for a single indicator, across countries."""
+    return label_data.xs(indicator, level="INDICATOR_ID").reset_index().drop_duplicates()
 
 # =============================================================================
 # NAVIGATION SETUP
@@ -80,54 +120,113 @@ def show_back_button():
             st.session_state.page = PARENTS[st.session_state.page]
 
 # =============================================================================
-# INDIVIDUAL ANALYSIS: MULTISELECT-ENABLED LINE CHART
+# CROSS-COUNTRY SETTINGS
 # =============================================================================
-def create_line_chart_with_selection(country_code):
+# Define the indicators with their descriptions
+INDICATORS = {
+    "EA.3T8.AG25T99": "Educational attainment rate, completed upper secondary education or higher, population 25+ years, both sexes (%)",
+    "XGOVEXP.IMF": "Expenditure on education as a percentage of total government expenditure (%)",
+    "XGDP.FSGOV": "Government expenditure on education as a percentage of GDP (%)",
+    "XUNIT.PPPCONST.2T3.FSGOV.FFNTR": "Initial government funding per secondary student, constant PPP$",
+    "NER.02.CP": "Net enrolment rate, pre-primary, both sexes (%)",
+    "ROFST.1T3.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, both sexes (%)",
+    "ROFST.1T3.F.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, female (%)",
+    "ROFST.1T3.M.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, male (%)",
+    "ROFST.H.3": "Out-of-school rate for youth of upper secondary school age, both sexes (household survey data) (%)",
+    "ROFST.3.F.CP": "Out-of-school rate for youth of upper secondary school age, female (%)",
+    "ROFST.3.M.CP": "Out-of-school rate for youth of upper secondary school age, male (%)",
+    "SCHBSP.2.WELEC": "Proportion of lower secondary schools with access to electricity (%)",
+    "SCHBSP.1.WCOMPUT": "Proportion of primary schools with access to computers for pedagogical purposes (%)",
+    "SCHBSP.1.WELEC": "Proportion of primary schools with access to electricity (%)",
+    "SCHBSP.2T3.WCOMPUT": "Proportion of secondary schools with access to computers for pedagogical purposes (%)",
+    "SCHBSP.3.WELEC": "Proportion of upper secondary schools with access to electricity (%)"
+}
+
+# Define a discrete color mapping for the countries
+COLOR_MAP = {
+    "NPL": "#FF6347",   # Tomato red
+    "USA": "#000080",   # Navy blue
+    "SLE": "#FFDB58",   # Mustard yellow
+    "EST": "#4682B4"    # Steel blue
+}
+
+# =============================================================================
+# DOWNSAMPLING
+# =============================================================================
+# Longest single trace handed to Plotly; longer series are reduced with LTTB
+MAX_POINTS_PER_TRACE = 500
+
+def lttb_indices(x, y, n_out):
     """
-    For the selected country, display a multiselect widget for the user to choose which
-    indicator(s) (variable) to display. Each option shows the indicator ID along with its label.
-    Returns a Plotly line chart with the selected indicators.
+    Largest-Triangle-Three-Buckets: positions of the `n_out` points of (x, y) that
+    best preserve the visual shape of the series. `x` must be sorted.
     """
-    df = label_data[label_data['country_id'] == country_code]
-    unique_indicators = df[['INDICATOR_ID', 'INDICATOR_LABEL_EN']].drop_duplicates().sort_values('INDICATOR_ID')
-    
-    # List of indicator IDs for the multiselect options
-    indicator_options = unique_indicators['INDICATOR_ID'].tolist()
-    
-    # Custom format function to display indicator id along with its label
-    def format_indicator(ind):
-        label = unique_indicators[unique_indicators['INDICATOR_ID'] == ind]['INDICATOR_LABEL_EN'].iloc[0]
-        return f"{ind} - {label}"
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
     
-    selected_indicators = st.multiselect(
-        "Select Indicator(s) to Display",
-        options=indicator_options,
-        format_func=format_indicator,
-        default=[]  # default to all if you wish; otherwise, set to [] for none
-    )
+    # First and last points are always kept; the rest is split into equal buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        keep[i + 1] = prev
+    return keep
+
+def downsample_series(df, group_col, max_points=MAX_POINTS_PER_TRACE):
+    """Reduce every `group_col` series in `df` longer than `max_points` with LTTB."""
+    if df.empty or df.groupby(group_col, observed=True).size().max() <= max_points:
+        return df
     
-    if not selected_indicators:
-        st.warning("Please select at least one indicator.")
-        return None
+    parts = []
+    for _, group in df.groupby(group_col, observed=True, sort=False):
+        group = group.sort_values('year')
+        idx = lttb_indices(group['year'].to_numpy(dtype=float), group['value'].to_numpy(dtype=float), max_points)
+        parts.append(group.iloc[idx])
+    return pd.concat(parts)
 
-    # Filter the dataframe to only include the selected indicators
-    df_filtered = df[df['INDICATOR_ID'].isin(selected_indicators)]
+# =============================================================================
+# CACHED FIGURE BUILDERS
+# Plotly figure construction dominates rerun cost, so figures are built once
+# per set of inputs and cached as plain dicts.
+# =============================================================================
+@st.cache_data
+def build_line_fig(data_version, country_code, indicators):
+    """Line chart of the given indicators (a tuple of IDs) for one country."""
+    df_filtered = downsample_series(filter_country_indicators(data_version, country_code, indicators), 'INDICATOR_ID')
     
-    fig = px.line(
-        df_filtered,
-        x='year',
-        y='value',
-        color='INDICATOR_ID',
-        markers=True,
-        custom_data=['INDICATOR_LABEL_EN'],
+    # SVG traces, not Scattergl: Plotly does not draw GL traces in the range slider
+    # preview, and series here are only tens of points long
+    fig = go.Figure()
+    for indicator_id, sub in df_filtered.groupby('INDICATOR_ID', observed=True, sort=False):
+        fig.add_trace(go.Scatter(
+            x=sub['year'].to_numpy(),
+            y=sub['value'].to_numpy(),
+            mode='lines+markers',
+            name=indicator_id,
+            customdata=sub[['INDICATOR_LABEL_EN']].to_numpy(),
+            hovertemplate='<b>%{customdata[0]}</b><br>Year: %{x}<br>Value: %{y}<extra></extra>'
+        ))
+    fig.update_layout(
         template='plotly_white',
-        labels={'year': 'Year', 'value': 'Value'},
-        height=700
+        height=700,
+        xaxis_title='Year',
+        yaxis_title='Value',
+        legend_title_text='INDICATOR_ID',
+        hovermode='x unified',
+        spikedistance=0,
+        margin=dict(l=60, r=60, t=40, b=80)
     )
-    fig.update_traces(
-        hovertemplate='<b>%{customdata[0]}</b><br>Year: %{x}<br>Value: %{y}<extra></extra>'
-    )
-    fig.update_layout(margin=dict(l=60, r=60, t=40, b=80))
     fig.update_xaxes(
         rangeslider_visible=True,
         rangeselector=dict(
@@ -138,7 +237,141 @@ def create_line_chart_with_selection(country_code):
             ]
         )
     )
-    return fig
+    return fig.to_dict()
+
+@st.cache_data
+def build_cross_line_fig(data_version, indicator):
+    """Cross-country line chart for one indicator."""
+    df = get_indicator_frame(data_version, indicator)
+    fig_line = px.line(
+        df,
+        x="year",
+        y="value",
+        color="country_id",
+        markers=True,
+        template="plotly_white",
+        labels={"year": "Year", "value": "Value", "country_id": "Country"},
+        color_discrete_map=COLOR_MAP,
+        height=700
+    )
+    # Hover by x-position; per-point "closest" hover and spike lookup scale with N
+    fig_line.update_layout(
+        hovermode="x unified",
+        spikedistance=0,
+        margin=dict(l=60, r=60, t=40, b=80)
+    )
+    fig_line.update_xaxes(
+        rangeslider_visible=True,
+        rangeselector=dict(
+            buttons=[
+                dict(count=5, label="Last 5 Years", step="year", stepmode="backward"),
+                dict(count=10, label="Last 10 Years", step="year", stepmode="backward"),
+                dict(step="all", label="All Years")
+            ]
+        )
+    )
+    return fig_line.to_dict()
+
+@st.cache_data
+def build_cross_area_fig(data_version, indicator):
+    """Cross-country area chart for one indicator."""
+    df = get_indicator_frame(data_version, indicator)
+    fig_area = px.area(
+        df,
+        x="year",
+        y="value",
+        color="country_id",
+        template="plotly_white",
+        labels={"year": "Year", "value": "Value", "country_id": "Country"},
+        color_discrete_map=COLOR_MAP,
+        height=700
+    )
+    # Reduce opacity for area chart
+    fig_area.update_traces(opacity=0.75)
+    fig_area.update_layout(
+        hovermode="x unified",
+        spikedistance=0,
+        margin=dict(l=60, r=60, t=40, b=80)
+    )
+    fig_area.update_xaxes(
+        rangeslider_visible=True,
+        rangeselector=dict(
+            buttons=[
+                dict(count=5, label="Last 5 Years", step="year", stepmode="backward"),
+                dict(count=10, label="Last 10 Years", step="year", stepmode="backward"),
+                dict(step="all", label="All Years")
+            ]
+        )
+    )
+    return fig_area.to_dict()
+
+@st.cache_data
+def build_cross_bar_fig(data_version, indicator):
+    """Cross-country bar chart of the yearly mean value for one indicator."""
+    df_bar = bar_agg.xs(indicator, level="INDICATOR_ID").reset_index()
+    
+    # Data is already aggregated, so feed go.Bar directly and skip px's grouping
+    fig_bar = go.Figure()
+    for country_id, sub in df_bar.groupby("country_id", observed=True):
+        fig_bar.add_bar(
+            x=sub["year"].to_numpy(),
+            y=sub["value"].to_numpy(),
+            name=country_id,
+            marker_color=COLOR_MAP[country_id],
+            hovertemplate=f"Country={country_id}<br>Year=%{{x}}<br>Average Value=%{{y}}<extra></extra>"
+        )
+    fig_bar.update_layout(
+        barmode="group",
+        template="plotly_white",
+        height=700,
+        xaxis_title="Year",
+        yaxis_title="Average Value",
+        legend_title_text="Country",
+        hovermode="x unified",
+        spikedistance=0,
+        margin=dict(l=60, r=60, t=40, b=80)
+    )
+    return fig_bar.to_dict()
+
+# =============================================================================
+# INDIVIDUAL ANALYSIS: MULTISELECT-ENABLED LINE CHART
+# =============================================================================
+def create_line_chart_with_selection(country_code):
+    """
+    For the selected country, display a multiselect widget for the user to choose which
+    indicator(s) (variable) to display. Each option shows the indicator ID along with its label.
+    Returns a Plotly line chart with the selected indicators.
+    """
+    unique_indicators = per_country_indicators[country_code]
+    
+    # List of indicator IDs for the multiselect options
+    indicator_options = unique_indicators['INDICATOR_ID'].tolist()
+    
+    # Map of indicator id -> label so the format function is a dict lookup
+    label_map = dict(zip(unique_indicators['INDICATOR_ID'], unique_indicators['INDICATOR_LABEL_EN']))
+    
+    # Plot every indicator only on request; many traces make the first paint slow
+    select_all = st.checkbox("Select all indicators")
+    
+    # The multiselect is hidden while everything is plotted so it never shows a
+    # subset that disagrees with the chart
+    if select_all:
+        selected_indicators = indicator_options
+    else:
+        selected_indicators = st.multiselect(
+            "Select Indicator(s) to Display",
+            options=indicator_options,
+            format_func=lambda ind: f"{ind} - {label_map[ind]}",
+            default=indicator_options[:3]
+        )
+    
+    # Only reachable once the user has cleared the default selection
+    if not selected_indicators:
+        st.warning("Please select at least one indicator.")
+        return None
+
+    # Figures are cached on a hashable (country, sorted indicators) key
+    return go.Figure(build_line_fig(DATA_VERSION, country_code, tuple(sorted(selected_indicators))))
 
 # =============================================================================
 # PAGE FUNCTIONS
@@ -173,167 +406,64 @@ def show_cross():
     """Cross-country Analysis page with indicator selection and multiple visualization types."""
     st.title("Cross-country Analysis")
     
-    # Define the indicators with their descriptions
-    indicators = {
-        "EA.3T8.AG25T99": "Educational attainment rate, completed upper secondary education or higher, population 25+ years, both sexes (%)",
-        "XGOVEXP.IMF": "Expenditure on education as a percentage of total government expenditure (%)",
-        "XGDP.FSGOV": "Government expenditure on education as a percentage of GDP (%)",
-        "XUNIT.PPPCONST.2T3.FSGOV.FFNTR": "Initial government funding per secondary student, constant PPP$",
-        "NER.02.CP": "Net enrolment rate, pre-primary, both sexes (%)",
-        "ROFST.1T3.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, both sexes (%)",
-        "ROFST.1T3.F.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, female (%)",
-        "ROFST.1T3.M.CP": "Out-of-school rate for children, adolescents and youth of primary, lower secondary and upper secondary school age, male (%)",
-        "ROFST.H.3": "Out-of-school rate for youth of upper secondary school age, both sexes (household survey data) (%)",
-        "ROFST.3.F.CP": "Out-of-school rate for youth of upper secondary school age, female (%)",
-        "ROFST.3.M.CP": "Out-of-school rate for youth of upper secondary school age, male (%)",
-        "SCHBSP.2.WELEC": "Proportion of lower secondary schools with access to electricity (%)",
-        "SCHBSP.1.WCOMPUT": "Proportion of primary schools with access to computers for pedagogical purposes (%)",
-        "SCHBSP.1.WELEC": "Proportion of primary schools with access to electricity (%)",
-        "SCHBSP.2T3.WCOMPUT": "Proportion of secondary schools with access to computers for pedagogical purposes (%)",
-        "SCHBSP.3.WELEC": "Proportion of upper secondary schools with access to electricity (%)"
-    }
-    
     # Create a selectbox for indicator selection.
     selected_indicator = st.selectbox(
         "Select an Indicator",
-        options=list(indicators.keys()),
-        format_func=lambda x: f"{x} - {indicators[x]}"
+        options=list(INDICATORS.keys()),
+        format_func=lambda x: f"{x} - {INDICATORS[x]}"
     )
     
-    st.write(f"Displaying cross-country analysis for: **{indicators[selected_indicator]}**")
+    st.write(f"Displaying cross-country analysis for: **{INDICATORS[selected_indicator]}**")
     
     # Extra space between text and graph
     st.markdown("<br><br>", unsafe_allow_html=True)
     
-    # Filter data for the selected indicator
-    df = label_data[label_data["INDICATOR_ID"] == selected_indicator].drop_duplicates()
-    
-    # Define a discrete color mapping for the countries
-    color_map = {
-        "NPL": "#FF6347",   # Tomato red
-        "USA": "#000080",   # Navy blue
-        "SLE": "#FFDB58",   # Mustard yellow
-        "EST": "#4682B4"    # Steel blue
-    }
-    
-    viz_tabs = st.tabs(["Line Chart", "Area Chart", "Bar Chart"])
-    
-    with viz_tabs[0]:
-        fig_line = px.line(
-            df,
-            x="year",
-            y="value",
-            color="country_id",
-            markers=True,
-            template="plotly_white",
-            labels={"year": "Year", "value": "Value", "country_id": "Country"},
-            color_discrete_map=color_map,
-            height=700
-        )
-        fig_line.update_layout(margin=dict(l=60, r=60, t=40, b=80))
-        fig_line.update_xaxes(
-            rangeslider_visible=True,
-            rangeselector=dict(
-                buttons=[
-                    dict(count=5, label="Last 5 Years", step="year", stepmode="backward"),
-                    dict(count=10, label="Last 10 Years", step="year", stepmode="backward"),
-                    dict(step="all", label="All Years")
-                ]
-            )
-        )
-        st.plotly_chart(fig_line, use_container_width=True)
-    
-    with viz_tabs[1]:
-        fig_area = px.area(
-            df,
-            x="year",
-            y="value",
-            color="country_id",
-            template="plotly_white",
-            labels={"year": "Year", "value": "Value", "country_id": "Country"},
-            color_discrete_map=color_map,
-            height=700
-        )
-        # Reduce opacity for area chart
-        fig_area.update_traces(opacity=0.75)
-        fig_area.update_layout(margin=dict(l=60, r=60, t=40, b=80))
-        fig_area.update_xaxes(
-            rangeslider_visible=True,
-            rangeselector=dict(
-                buttons=[
-                    dict(count=5, label="Last 5 Years", step="year", stepmode="backward"),
-                    dict(count=10, label="Last 10 Years", step="year", stepmode="backward"),
-                    dict(step="all", label="All Years")
-                ]
-            )
-        )
-        st.plotly_chart(fig_area, use_container_width=True)
+    # Only the selected chart is built and sent to the browser on each rerun
+    chart_type = st.radio("Chart type", ["Line Chart", "Area Chart", "Bar Chart"], horizontal=True)
     
-    with viz_tabs[2]:
-        df_bar = df.groupby(["year", "country_id"])["value"].mean().reset_index()
-        fig_bar = px.bar(
-            df_bar,
-            x="year",
-            y="value",
-            color="country_id",
-            barmode="group",
-            template="plotly_white",
-            labels={"year": "Year", "value": "Average Value", "country_id": "Country"},
-            color_discrete_map=color_map,
-            height=700
-        )
-        fig_bar.update_layout(margin=dict(l=60, r=60, t=40, b=80))
-        st.plotly_chart(fig_bar, use_container_width=True)
+    if chart_type == "Line Chart":
+        fig = go.Figure(build_cross_line_fig(DATA_VERSION, selected_indicator))
+    elif chart_type == "Area Chart":
+        fig = go.Figure(build_cross_area_fig(DATA_VERSION, selected_indicator))
+    else:
+        fig = go.Figure(build_cross_bar_fig(DATA_VERSION, selected_indicator))
+    st.plotly_chart(fig, use_container_width=True)
 
 # =============================================================================
 # INDIVIDUAL ANALYSIS PAGES (USING MULTISELECT FOR INDICATOR SELECTION)
 # =============================================================================
-def show_nepal():
-    st.title("Nepal Analysis")
-    fig = create_line_chart_with_selection('NPL')
-    if fig is not None:
-        st.plotly_chart(fig, use_container_width=True)
-
-def show_estonia():
-    st.title("Estonia Analysis")
-    fig = create_line_chart_with_selection('EST')
-    if fig is not None:
-        st.plotly_chart(fig, use_container_width=True)
-
-def show_sierra_leone():
-    st.title("Sierra Leone Analysis")
-    fig = create_line_chart_with_selection('SLE')
-    if fig is not None:
-        st.plotly_chart(fig, use_container_width=True)
+# Page name -> (country code, display title)
+PAGE_TO_COUNTRY = {
+    "Nepal": ("NPL", "Nepal"),
+    "USA": ("USA", "USA"),
+    "Estonia": ("EST", "Estonia"),
+    "Sierra Leone": ("SLE", "Sierra Leone")
+}
 
-def show_usa():
-    st.title("USA Analysis")
-    fig = create_line_chart_with_selection('USA')
+def show_country(country_code, title):
+    """Individual Analysis page for a single country."""
+    st.title(f"{title} Analysis")
+    fig = create_line_chart_with_selection(country_code)
     if fig is not None:
         st.plotly_chart(fig, use_container_width=True)
 
 # =============================================================================
 # MAIN APP FUNCTION
 # =============================================================================
+# Page name -> function that renders it
+PAGES = {
+    "home": show_home,
+    "individual": show_individual,
+    "cross": show_cross,
+    **{page: partial(show_country, *country) for page, country in PAGE_TO_COUNTRY.items()}
+}
+
 def main():
     if "page" not in st.session_state:
         st.session_state.page = "home"
     show_back_button()
     
-    if st.session_state.page == "home":
-        show_home()
-    elif st.session_state.page == "individual":
-        show_individual()
-    elif st.session_state.page == "cross":
-        show_cross()
-    elif st.session_state.page == "Nepal":
-        show_nepal()
-    elif st.session_state.page == "Estonia":
-        show_estonia()
-    elif st.session_state.page == "Sierra Leone":
-        show_sierra_leone()
-    elif st.session_state.page == "USA":
-        show_usa()
+    PAGES.get(st.session_state.page, show_home)()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,45 @@
+import pandas as pd
+
+# =============================================================================
+# ONE-TIME BUILD OF THE APP DATA FILE
+# Run `python build_data.py` whenever the source CSVs change.
+# =============================================================================
+DATA_CSV = 'UNESCO_edu_data.csv'
+METADATA_CSV = 'SDG_METADATA.csv'
+LABEL_DATA_PARQUET = 'label_data.parquet'
+
+def build_label_data():
+    """Parse the UNESCO data and SDG metadata CSVs and merge them into one frame."""
+    # Only parse the columns the app uses, with explicit dtypes to skip inference.
+    # The pyarrow engine parses in parallel; the metadata is all strings, so it is
+    # kept as Arrow-backed string columns rather than Python objects.
+    data = pd.read_csv(
+        DATA_CSV,
+        engine='pyarrow',
+        usecols=['country_id', 'indicator_id', 'year', 'value'],
+        dtype={'country_id': 'category', 'indicator_id': 'category', 'year': 'int16', 'value': 'float32'}
+    )
+    metadata = pd.read_csv(
+        METADATA_CSV,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        usecols=['INDICATOR_ID', 'INDICATOR_LABEL_EN']
+    )
+    
+    # Processing and combining data on Indicator ID and Indicator Label
+    data.rename(columns={'indicator_id': 'INDICATOR_ID'}, inplace=True)
+    data['INDICATOR_ID'] = data['INDICATOR_ID'].str.upper().str.strip()
+    
+    # Attach the indicator label; a map lookup is cheaper than a full merge for one column
+    label_series = metadata.set_index('INDICATOR_ID')['INDICATOR_LABEL_EN']
+    data['INDICATOR_LABEL_EN'] = data['INDICATOR_ID'].map(label_series)
+    label_data = data
+    
+    # Categorical keys make the app's == / isin filters compare integer codes
+    for col in ['country_id', 'INDICATOR_ID', 'INDICATOR_LABEL_EN']:
+        label_data[col] = label_data[col].astype('category')
+    return label_data
+
+if __name__ == "__main__":
+    build_label_data().to_parquet(LABEL_DATA_PARQUET, compression='zstd')
+    print(f"Wrote {LABEL_DATA_PARQUET}")